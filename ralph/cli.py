@@ -2,6 +2,7 @@
 
 import json
 import subprocess
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -15,7 +16,9 @@ from .harness import (
     get_ralph_dir,
     is_git_repo,
     load_prd,
+    load_prd_unchecked,
     run_loop,
+    save_prd,
 )
 from .models import PRD, GlobalConfig, ItemState, ProjectMeta
 
@@ -26,29 +29,68 @@ app = typer.Typer(
 )
 console = Console()
 
+# Rich markup used for each item state in the status table
+STATE_MARKUP = {
+    state: f"[{color}]{state.value}[/{color}]"
+    for state, color in (
+        (ItemState.TODO, "white"),
+        (ItemState.DOING, "yellow"),
+        (ItemState.DONE, "green"),
+        (ItemState.BLOCKED, "red"),
+    )
+}
+
+# How long the cached `opencode models` output is reused, in seconds
+MODELS_CACHE_TTL = 3600
+
+
+def get_models_cache_path() -> Path:
+    """Get the path of the cached model list."""
+    return Path(typer.get_app_dir("ralph")) / "models.json"
+
+
+def get_available_models(refresh: bool = False) -> list[str]:
+    """Get list of available models from opencode.
+
+    Results are cached for MODELS_CACHE_TTL seconds; pass refresh=True to
+    bypass the cache and re-query opencode.
+    """
+    cache_path = get_models_cache_path()
+    if not refresh:
+        try:
+            if time.time() - cache_path.stat().st_mtime < MODELS_CACHE_TTL:
+                cached = json.loads(cache_path.read_text())
+                if isinstance(cached, list) and cached:
+                    return cached
+        except (OSError, ValueError):
+            pass
 
-def get_available_models() -> list[str]:
-    """Get list of available models from opencode."""
     try:
         result = subprocess.run(
             ["opencode", "models"],
             capture_output=True,
             text=True,
         )
-        if result.returncode == 0:
-            return [
-                line.strip()
-                for line in result.stdout.strip().split("\n")
-                if line.strip()
-            ]
-        return []
+        if result.returncode != 0:
+            return []
+        models = [
+            line.strip() for line in result.stdout.strip().split("\n") if line.strip()
+        ]
     except Exception:
         return []
 
+    if models:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(models))
+        except OSError:
+            pass
+    return models
+
 
-def select_model_interactive() -> Optional[str]:
+def select_model_interactive(refresh: bool = False) -> Optional[str]:
     """Show interactive model selection prompt."""
-    models = get_available_models()
+    models = get_available_models(refresh=refresh)
     if not models:
         console.print("[red]Error: Could not fetch models from opencode[/red]")
         console.print("Make sure opencode is installed and configured.")
@@ -75,6 +117,25 @@ def select_model_interactive() -> Optional[str]:
             return None
 
 
+def truncate(text: str, width: int) -> str:
+    """Shorten text to width characters, marking the cut with '...'."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def status_rows(prd: PRD) -> list[tuple[str, ...]]:
+    """Build the 'ralph status' table rows for each item."""
+    return [
+        (
+            item.id,
+            truncate(item.title, 40),
+            STATE_MARKUP[item.status.state],
+            str(item.status.attempts),
+            truncate(item.status.last_error or "", 50),
+        )
+        for item in prd.items
+    ]
+
+
 def get_repo_root() -> Path:
     """Get the repository root (current working directory)."""
     return Path.cwd()
@@ -113,12 +174,11 @@ def init(
             language=language,
             default_branch=branch,
         ),
-        global_config=GlobalConfig(verify=[]),
+        global_config=GlobalConfig(verify=()),
         items=[],
     )
 
-    with open(prd_path, "w") as f:
-        json.dump(prd.model_dump(by_alias=True), f, indent=2)
+    save_prd(repo_root, prd)
 
     # Create empty progress log
     progress_path.touch()
@@ -211,6 +271,11 @@ def run(
         "-I",
         help="Interactively select model from available options",
     ),
+    refresh_models: bool = typer.Option(
+        False,
+        "--refresh-models",
+        help="Re-fetch the model list for --interactive instead of using the cache",
+    ),
     max_iterations: int = typer.Option(
         50, "--max-iterations", "-i", help="Maximum number of iterations"
     ),
@@ -220,13 +285,18 @@ def run(
     no_commit: bool = typer.Option(
         False, "--no-commit", help="Don't commit changes (dry run)"
     ),
+    parallel_verify: bool = typer.Option(
+        False,
+        "--parallel-verify",
+        help="Run an item's verification commands concurrently",
+    ),
 ):
     """Start the harness loop to process PRD items."""
     repo_root = get_repo_root()
 
     # Handle model selection
     if interactive:
-        selected_model = select_model_interactive()
+        selected_model = select_model_interactive(refresh=refresh_models)
         if selected_model is None:
             raise typer.Exit(1)
         model = selected_model
@@ -255,6 +325,7 @@ def run(
     console.print(f"  Max iterations: {max_iterations}")
     console.print(f"  Max failures: {max_failures}")
     console.print(f"  Commit changes: {not no_commit}")
+    console.print(f"  Parallel verify: {parallel_verify}")
     console.print()
 
     exit_code = run_loop(
@@ -262,6 +333,7 @@ def run(
         max_iterations=max_iterations,
         max_failures=max_failures,
         no_commit=no_commit,
+        parallel_verify=parallel_verify,
         model=model,
     )
 
@@ -274,7 +346,17 @@ def status():
     repo_root = get_repo_root()
 
     try:
-        prd = load_prd(repo_root)
+        try:
+            # Display only, so try the cheaper unchecked load first
+            prd = load_prd_unchecked(repo_root)
+            rows = status_rows(prd)
+        except FileNotFoundError:
+            raise
+        except Exception:
+            # prd.json may have been hand-edited: validate it so a bad file
+            # gets a proper error message rather than a traceback
+            prd = load_prd(repo_root)
+            rows = status_rows(prd)
     except FileNotFoundError:
         console.print("[red]Error: .ralph directory not found[/red]")
         console.print("Run 'ralph init' first to initialize.")
@@ -305,27 +387,8 @@ def status():
     table.add_column("Attempts", justify="right")
     table.add_column("Last Error")
 
-    state_colors = {
-        ItemState.TODO: "white",
-        ItemState.DOING: "yellow",
-        ItemState.DONE: "green",
-        ItemState.BLOCKED: "red",
-    }
-
-    for item in prd.items:
-        state_str = f"[{state_colors[item.status.state]}]{item.status.state.value}[/{state_colors[item.status.state]}]"
-        error_str = (
-            item.status.last_error[:50] + "..."
-            if item.status.last_error and len(item.status.last_error) > 50
-            else (item.status.last_error or "")
-        )
-        table.add_row(
-            item.id,
-            item.title[:40] + ("..." if len(item.title) > 40 else ""),
-            state_str,
-            str(item.status.attempts),
-            error_str,
-        )
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -382,7 +445,7 @@ def reset(
             console.print(f"[red]Item not found: {item_id}[/red]")
             raise typer.Exit(1)
 
-        if item.status.state == ItemState.BLOCKED and not include_blocked:
+        if item.status.state is ItemState.BLOCKED and not include_blocked:
             console.print(
                 f"[yellow]Item {item_id} is blocked. Use --include-blocked to reset.[/yellow]"
             )
@@ -396,9 +459,9 @@ def reset(
     else:
         # Reset all items
         for item in prd.items:
-            if item.status.state == ItemState.BLOCKED and not include_blocked:
+            if item.status.state is ItemState.BLOCKED and not include_blocked:
                 continue
-            if item.status.state != ItemState.TODO:
+            if item.status.state is not ItemState.TODO:
                 item.status.state = ItemState.TODO
                 item.status.attempts = 0
                 item.status.last_error = None
@@ -406,8 +469,6 @@ def reset(
                 reset_count += 1
 
     # Save PRD
-    from .harness import save_prd
-
     save_prd(repo_root, prd)
 
     console.print(f"[green]Reset {reset_count} item(s) to todo state[/green]")
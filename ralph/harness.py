@@ -1,14 +1,30 @@
 """Core harness logic for ralph."""
 
 import json
+import os
+import shlex
+import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import IO, Optional, Sequence
 
+from pydantic import ValidationError
 from rich.console import Console
 
 from .models import PRD, ItemState, WorkItem
 
+# orjson only speeds up read_prd_data (the unchecked load behind 'ralph
+# status'); load_prd parses inside pydantic-core and never uses it
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to stdlib json
+    orjson = None
+
 console = Console()
 
 RALPH_DIR = ".ralph"
@@ -18,6 +34,73 @@ PROGRESS_FILE = "progress.txt"
 # Default blocked threshold - mark as blocked after this many failed attempts
 BLOCKED_THRESHOLD = 3
 
+# Verify commands containing any of these need a real shell (pipes, redirects,
+# globs, expansions, ...); everything else is exec'd directly
+SHELL_METACHARS = frozenset("|&;<>()$`*?[]{}~!#\n")
+
+# Shell builtins (POSIX special and regular, plus common extensions); these may
+# have no executable on PATH, so commands starting with one go through the shell
+SHELL_BUILTINS = frozenset(
+    ". : alias bg break cd command continue eval exec exit export false fc fg"
+    " getopts hash jobs kill local newgrp pwd read readonly return set shift"
+    " source times trap true type ulimit umask unalias unset wait".split()
+)
+
+# Only the tail of each verify command's stdout/stderr is kept in the results
+OUTPUT_TAIL_BYTES = 2000
+
+# Agent prompt, filled in per item by build_agent_prompt. {files} is either
+# empty or a complete "Files to focus on" section.
+PROMPT_TEMPLATE = """You are an autonomous coding agent working on a software project.
+
+## Your Task
+
+You must implement the following work item:
+
+**ID:** {id}
+**Title:** {title}
+
+**Description:**
+{desc}
+
+**Acceptance Criteria:**
+{accept}
+
+{files}## Project Context
+
+- **Project Name:** {project_name}
+- **Language:** {language}
+- **Default Branch:** {default_branch}
+
+## Rules
+
+1. Make minimal, focused changes to implement the task
+2. Do NOT mark the item as done - the harness will do that after verification
+3. Update or create tests as needed to cover your changes
+4. Ensure the codebase compiles/runs after your changes
+5. Follow existing code style and conventions
+6. If you encounter blockers, document them clearly
+
+## Verification Commands
+
+After your changes, the following commands will be run to verify success:
+{verify_cmds}
+
+## Long-term Memory
+
+You can read and write to the progress log file at `{progress_path}` to maintain context across sessions.
+Use this file to:
+- Record important decisions and reasoning
+- Note any issues encountered
+- Track partial progress on complex tasks
+- Leave notes for future iterations
+
+## Instructions
+
+Implement the task described above. Make the necessary code changes to satisfy all acceptance criteria.
+When you are done making changes, simply finish your session - do not try to mark the task as complete.
+"""
+
 
 def get_ralph_dir(repo_root: Path) -> Path:
     """Get the .ralph directory path."""
@@ -34,42 +117,102 @@ def get_progress_path(repo_root: Path) -> Path:
     return get_ralph_dir(repo_root) / PROGRESS_FILE
 
 
-def load_prd(repo_root: Path) -> PRD:
-    """Load and validate the PRD from disk."""
+def read_prd_bytes(repo_root: Path) -> bytes:
+    """Read the raw contents of prd.json."""
     prd_path = get_prd_path(repo_root)
     if not prd_path.exists():
         raise FileNotFoundError(f"PRD file not found: {prd_path}")
+    return prd_path.read_bytes()
+
+
+def read_prd_data(repo_root: Path) -> dict:
+    """Read and parse prd.json into plain Python data."""
+    raw = read_prd_bytes(repo_root)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def load_prd(repo_root: Path) -> PRD:
+    """Load and validate the PRD from disk."""
+    raw = read_prd_bytes(repo_root)
+    try:
+        return PRD.load_json_bytes(raw)
+    except ValidationError as e:
+        # Surface malformed JSON as JSONDecodeError (with position) like before
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            json.loads(raw)
+        raise
+
+
+def load_prd_unchecked(repo_root: Path) -> PRD:
+    """Load the PRD from disk without running pydantic validation.
 
-    with open(prd_path) as f:
-        data = json.load(f)
+    Meant for read-only views of a PRD ralph wrote itself - use load_prd
+    wherever the result is acted upon or written back.
+    """
+    return PRD.from_trusted_dict(read_prd_data(repo_root))
 
-    return PRD.model_validate(data)
 
+def save_prd(repo_root: Path, prd: PRD) -> int:
+    """Save the PRD to disk.
 
-def save_prd(repo_root: Path, prd: PRD) -> None:
-    """Save the PRD to disk."""
+    Returns the file's new mtime in nanoseconds, so callers can tell their own
+    writes apart from external edits.
+    """
     prd_path = get_prd_path(repo_root)
-    with open(prd_path, "w") as f:
-        json.dump(prd.model_dump(by_alias=True), f, indent=2, default=str)
+    # pydantic-core walks and encodes the model in one pass, with no dict in between
+    payload = prd.model_dump_json(by_alias=True, indent=2).encode()
+    # Write a sibling temp file and rename it over prd.json, so readers (and a
+    # crash mid-write) only ever see the old or the new document
+    tmp_path = prd_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, prd_path)
+    return prd_path.stat().st_mtime_ns
+
+
+class ProgressLog:
+    """Append-only writer for progress.txt.
+
+    The file is opened once for the duration of the ``with`` block and writes
+    are buffered; call ``flush()`` at iteration boundaries and before handing
+    control to the agent, which may read or append to the same file.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.path = get_progress_path(repo_root)
+        self._file: Optional[IO[str]] = None
+
+    def __enter__(self) -> "ProgressLog":
+        self._file = open(self.path, "a", buffering=8192)
+        return self
 
+    def __exit__(self, *exc_info: object) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
-def append_progress(repo_root: Path, message: str) -> None:
-    """Append a message to progress.log with timestamp."""
-    progress_path = get_progress_path(repo_root)
-    timestamp = datetime.now(timezone.utc).isoformat()
-    with open(progress_path, "a") as f:
-        f.write(f"[{timestamp}] {message}\n")
+    def log(self, message: str) -> None:
+        """Append a message to the log with timestamp."""
+        if self._file is None:
+            raise RuntimeError("ProgressLog used outside of a 'with' block")
+        # time.gmtime/strftime avoids building an aware datetime per line
+        now = time.time()
+        seconds = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
+        self._file.write(f"[{seconds}.{int(now % 1 * 1e6):06d}Z] {message}\n")
+
+    def flush(self) -> None:
+        """Flush buffered log lines to disk."""
+        if self._file is not None:
+            self._file.flush()
 
 
 def is_git_repo(path: Path) -> bool:
-    """Check if the path is inside a git repository."""
-    result = subprocess.run(
-        ["git", "rev-parse", "--git-dir"],
-        cwd=path,
-        capture_output=True,
-        text=True,
-    )
-    return result.returncode == 0
+    """Check if the path is inside a git repository.
+
+    Walks up looking for a ``.git`` entry (a directory, or a file for worktrees
+    and submodules) instead of forking ``git rev-parse``.
+    """
+    path = path.resolve()
+    return any((parent / ".git").exists() for parent in (path, *path.parents))
 
 
 def git_commit(repo_root: Path, message: str) -> bool:
@@ -80,13 +223,15 @@ def git_commit(repo_root: Path, message: str) -> bool:
             ["git", "add", "-A"],
             cwd=repo_root,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
-        # Check if there are changes to commit
+        # Check if there are changes to commit (signalled via exit code only)
         result = subprocess.run(
             ["git", "diff", "--cached", "--quiet"],
             cwd=repo_root,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         if result.returncode == 0:
             # No changes to commit
@@ -96,121 +241,211 @@ def git_commit(repo_root: Path, message: str) -> bool:
             ["git", "commit", "-m", message],
             cwd=repo_root,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
         return True
     except subprocess.CalledProcessError as e:
         console.print(f"[red]Git commit failed: {e}[/red]")
+        if e.stderr:
+            console.print(e.stderr.decode(errors="replace").strip(), markup=False)
         return False
 
 
-def build_agent_prompt(item: WorkItem, prd: PRD, repo_root: Path) -> str:
-    """Build the prompt for the LLM agent."""
-    progress_path = get_progress_path(repo_root)
-
-    prompt = f"""You are an autonomous coding agent working on a software project.
-
-## Your Task
-
-You must implement the following work item:
-
-**ID:** {item.id}
-**Title:** {item.title}
-
-**Description:**
-{item.description}
-
-**Acceptance Criteria:**
-{chr(10).join(f"- {criterion}" for criterion in item.acceptance_criteria)}
-
-"""
-    if item.files_hint:
-        prompt += f"""**Files to focus on:**
-{chr(10).join(f"- {f}" for f in item.files_hint)}
-
-"""
-
-    prompt += f"""## Project Context
-
-- **Project Name:** {prd.project.name}
-- **Language:** {prd.project.language}
-- **Default Branch:** {prd.project.default_branch}
+def build_agent_prompt(
+    item: WorkItem,
+    prd: PRD,
+    repo_root: Path,
+    verify: Optional[Sequence[str]] = None,
+) -> str:
+    """Build the prompt for the LLM agent.
 
-## Rules
+    ``verify`` is the item's resolved verification commands; when omitted it
+    falls back to ``item.verify or prd.global_config.verify``.
+    """
+    if verify is None:
+        verify = item.verify or prd.global_config.verify
+    return render_agent_prompt(
+        (
+            item.id,
+            item.title,
+            item.description,
+            tuple(item.acceptance_criteria),
+            tuple(item.files_hint),
+        ),
+        (prd.project.name, prd.project.language, prd.project.default_branch),
+        tuple(verify),
+        str(get_progress_path(repo_root)),
+    )
 
-1. Make minimal, focused changes to implement the task
-2. Do NOT mark the item as done - the harness will do that after verification
-3. Update or create tests as needed to cover your changes
-4. Ensure the codebase compiles/runs after your changes
-5. Follow existing code style and conventions
-6. If you encounter blockers, document them clearly
 
-## Verification Commands
+@lru_cache(maxsize=128)
+def render_agent_prompt(
+    item_fields: tuple[str, str, str, tuple[str, ...], tuple[str, ...]],
+    project_fields: tuple[str, str, str],
+    verify: tuple[str, ...],
+    progress_path: str,
+) -> str:
+    """Render PROMPT_TEMPLATE from hashable prompt inputs.
 
-After your changes, the following commands will be run to verify success:
-{chr(10).join(f"- `{cmd}`" for cmd in (item.verify or prd.global_config.verify))}
+    Memoized so an item that is retried or resumed reuses its prompt string.
+    """
+    item_id, title, description, acceptance_criteria, files_hint = item_fields
+    project_name, language, default_branch = project_fields
+
+    files_section = ""
+    if files_hint:
+        files = "\n".join(f"- {f}" for f in files_hint)
+        files_section = f"**Files to focus on:**\n{files}\n\n"
+
+    return PROMPT_TEMPLATE.format_map(
+        {
+            "id": item_id,
+            "title": title,
+            "desc": description,
+            "accept": "\n".join(f"- {c}" for c in acceptance_criteria),
+            "files": files_section,
+            "project_name": project_name,
+            "language": language,
+            "default_branch": default_branch,
+            "verify_cmds": "\n".join(f"- `{cmd}`" for cmd in verify),
+            "progress_path": progress_path,
+        }
+    )
 
-## Long-term Memory
 
-You can read and write to the progress log file at `{progress_path}` to maintain context across sessions.
-Use this file to:
-- Record important decisions and reasoning
-- Note any issues encountered
-- Track partial progress on complex tasks
-- Leave notes for future iterations
+def split_command(cmd: str, cwd: Path) -> Optional[list[str]]:
+    """Split a verify command into argv, or return None if it needs a shell.
 
-## Instructions
+    Builtins and programs that cannot be found also return None, so the shell
+    runs them and reports a missing command with exit code 127 as before.
+    """
+    if any(c in SHELL_METACHARS for c in cmd):
+        return None
+    try:
+        argv = shlex.split(cmd)
+    except ValueError:
+        return None
+    # "FOO=1 pytest" sets an environment variable, which only a shell can do
+    if not argv or "=" in argv[0]:
+        return None
+    program = argv[0]
+    if program in SHELL_BUILTINS:
+        return None
+    # Paths such as ./check.sh resolve against the command's cwd, not ours
+    if shutil.which(cwd / program if os.sep in program else program) is None:
+        return None
+    return argv
+
+
+def read_tail(stream: IO[bytes], limit: int = OUTPUT_TAIL_BYTES) -> bytes:
+    """Read a stream to EOF, keeping only its last ``limit`` bytes."""
+    tail = bytearray()
+    for chunk in iter(lambda: stream.read(4096), b""):
+        tail += chunk
+        del tail[:-limit]
+    return bytes(tail)
+
+
+def run_command(cmd: str, cwd: Path) -> tuple[int, str, str]:
+    """Run a verify command, returning (returncode, stdout_tail, stderr_tail).
+
+    Output is streamed and trimmed as it arrives, so memory stays bounded by
+    OUTPUT_TAIL_BYTES per stream no matter how noisy the command is.
+    """
+    # Exec simple commands directly to skip the intermediate /bin/sh.
+    # Our own fds are non-inheritable (PEP 446), so close_fds=False is
+    # safe and avoids closing every descriptor in the child.
+    argv = split_command(cmd, cwd)
+    with subprocess.Popen(
+        argv if argv is not None else cmd,
+        shell=argv is None,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+    ) as proc:
+        assert proc.stdout is not None and proc.stderr is not None
+        stderr_stream = proc.stderr
+        # Drain stderr in a thread so neither pipe can fill up and block the child
+        stderr_tail: list[bytes] = []
+        stderr_reader = threading.Thread(
+            target=lambda stream: stderr_tail.append(read_tail(stream)),
+            args=(stderr_stream,),
+        )
+        stderr_reader.start()
+        stdout = read_tail(proc.stdout)
+        stderr_reader.join()
+        returncode = proc.wait()
+
+    stderr = stderr_tail[0] if stderr_tail else b""
+    return (
+        returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
 
-Implement the task described above. Make the necessary code changes to satisfy all acceptance criteria.
-When you are done making changes, simply finish your session - do not try to mark the task as complete.
-"""
-    return prompt
 
+def run_verify_command(cmd: str, repo_root: Path) -> tuple[dict, str]:
+    """Run a single verification command.
 
-def run_verification(repo_root: Path, commands: list[str]) -> tuple[bool, list[dict]]:
-    """Run verification commands and return success status and results."""
+    Returns (result, status) where status is a Rich-formatted outcome line.
+    """
+    try:
+        returncode, stdout, stderr = run_command(cmd, repo_root)
+    except Exception as e:
+        result = {
+            "command": cmd,
+            "passed": False,
+            "returncode": -1,
+            "stdout": "",
+            "stderr": str(e),
+        }
+        return result, f"[red]ERROR: {e}[/red]"
+
+    passed = returncode == 0
+    result = {
+        "command": cmd,
+        "passed": passed,
+        "returncode": returncode,
+        "stdout": stdout,
+        "stderr": stderr,
+    }
+    if passed:
+        return result, "[green]PASSED[/green]"
+    return result, f"[red]FAILED (exit code {returncode})[/red]"
+
+
+def run_verification(
+    repo_root: Path, commands: Sequence[str], parallel: bool = False
+) -> tuple[bool, list[dict]]:
+    """Run verification commands and return success status and results.
+
+    With parallel=True the commands run concurrently; results (and their
+    status lines) are still reported in the original command order.
+    """
     results = []
-    all_passed = True
-
-    for cmd in commands:
-        console.print(f"  Running: [cyan]{cmd}[/cyan]")
-        try:
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-            )
-            passed = result.returncode == 0
-            results.append(
-                {
-                    "command": cmd,
-                    "passed": passed,
-                    "returncode": result.returncode,
-                    "stdout": result.stdout[-2000:] if result.stdout else "",
-                    "stderr": result.stderr[-2000:] if result.stderr else "",
-                }
-            )
-            if passed:
-                console.print("    [green]PASSED[/green]")
-            else:
-                console.print(f"    [red]FAILED (exit code {result.returncode})[/red]")
-                all_passed = False
-        except Exception as e:
-            results.append(
-                {
-                    "command": cmd,
-                    "passed": False,
-                    "returncode": -1,
-                    "stdout": "",
-                    "stderr": str(e),
-                }
-            )
-            console.print(f"    [red]ERROR: {e}[/red]")
-            all_passed = False
 
-    return all_passed, results
+    if parallel and len(commands) > 1:
+        for cmd in commands:
+            console.print(f"  Running: [cyan]{cmd}[/cyan]")
+        max_workers = min(len(commands), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(run_verify_command, cmd, repo_root) for cmd in commands
+            ]
+            for cmd, future in zip(commands, futures):
+                result, status = future.result()
+                console.print(f"    [cyan]{cmd}[/cyan]: {status}")
+                results.append(result)
+    else:
+        for cmd in commands:
+            console.print(f"  Running: [cyan]{cmd}[/cyan]")
+            result, status = run_verify_command(cmd, repo_root)
+            console.print(f"    {status}")
+            results.append(result)
+
+    return all(r["passed"] for r in results), results
 
 
 def run_agent(repo_root: Path, prompt: str, model: str) -> tuple[bool, str]:
@@ -226,9 +461,13 @@ def run_agent(repo_root: Path, prompt: str, model: str) -> tuple[bool, str]:
         # Important: do NOT pipe stdout/stderr. Some agents switch behavior and
         # may not emit output when not connected to a real TTY. Inheriting the
         # parent's streams guarantees visibility in the main process.
+        # close_fds=False skips closing every descriptor in the child; the
+        # harness's own fds (prd.json, progress.txt) are non-inheritable per
+        # PEP 446, so the agent still only receives stdio.
         result = subprocess.run(
             agent_command,
             cwd=repo_root,
+            close_fds=False,
         )
 
         if result.returncode != 0:
@@ -246,6 +485,7 @@ def run_loop(
     max_iterations: int = 50,
     max_failures: int = 10,
     no_commit: bool = False,
+    parallel_verify: bool = False,
 ) -> int:
     """Run the main harness loop.
 
@@ -256,8 +496,10 @@ def run_loop(
         console.print("[red]Error: Not a git repository[/red]")
         return 1
 
+    prd_path = get_prd_path(repo_root)
     try:
         prd = load_prd(repo_root)
+        prd_mtime = prd_path.stat().st_mtime_ns
     except FileNotFoundError as e:
         console.print(f"[red]Error: {e}[/red]")
         console.print("Run 'ralph init' first to create the .ralph directory")
@@ -269,175 +511,178 @@ def run_loop(
         console.print(f"[red]Error loading PRD: {e}[/red]")
         return 1
 
-    # Ensure progress.log exists
-    progress_path = get_progress_path(repo_root)
-    if not progress_path.exists():
-        progress_path.touch()
+    with ProgressLog(repo_root) as progress:
+        iteration = 0
+        failures = 0
+
+        progress.log(
+            f"=== Harness started (max_iterations={max_iterations}, max_failures={max_failures}) ===",
+        )
 
-    iteration = 0
-    failures = 0
+        while iteration < max_iterations and failures < max_failures:
+            # Persist the previous iteration's log lines
+            progress.flush()
+
+            # Reload PRD only if it was modified since we last read or wrote it
+            mtime = prd_path.stat().st_mtime_ns
+            if mtime != prd_mtime:
+                prd = load_prd(repo_root)
+                prd_mtime = mtime
+
+            # Check if all done
+            if prd.all_done():
+                console.print("\n[green]All items complete![/green]")
+                progress.log("=== All items complete ===")
+                return 0
+
+            # Select next item (resume "doing" first, then "todo")
+            item, is_resuming = prd.get_next_item()
+            if item is None:
+                console.print("\n[yellow]No more items to process[/yellow]")
+                counts = prd.count_by_state()
+                console.print(
+                    f"  Done: {counts[ItemState.DONE]}, Blocked: {counts[ItemState.BLOCKED]}"
+                )
+                progress.log("=== No more items to process ===")
+                return 0 if counts[ItemState.BLOCKED] == 0 else 1
+
+            iteration += 1
+            console.print(f"\n[bold]Iteration {iteration}/{max_iterations}[/bold]")
+            console.print(f"  Item: [cyan]{item.id}[/cyan] - {item.title}")
+            if item.description:
+                console.print(f"\n[bold]Description[/bold]\n{item.description.strip()}")
+            if item.acceptance_criteria:
+                console.print("\n[bold]Acceptance Criteria[/bold]")
+                for criterion in item.acceptance_criteria:
+                    console.print(f"- {criterion}")
+            if item.files_hint:
+                console.print("\n[bold]Files[/bold]")
+                for f in item.files_hint:
+                    console.print(f"- {f}")
+            # Resolve the verify commands once for preview, prompt and verification
+            verify_commands = tuple(item.verify or prd.global_config.verify)
+            if verify_commands:
+                console.print("\n[bold]Verify[/bold]")
+                for cmd in verify_commands:
+                    console.print(f"- {cmd}")
+
+            if is_resuming:
+                console.print(
+                    f"  [yellow]Resuming[/yellow] (attempt {item.status.attempts})"
+                )
+                progress.log(
+                    f"Resuming item {item.id} (attempt {item.status.attempts}): {item.title}",
+                )
+            else:
+                # Mark as doing and increment attempts (crash-safe write)
+                item.status.state = ItemState.DOING
+                item.status.attempts += 1
+                prd_mtime = save_prd(repo_root, prd)
+                console.print(f"  Attempt: {item.status.attempts}")
+                progress.log(
+                    f"Starting item {item.id} (attempt {item.status.attempts}): {item.title}",
+                )
 
-    append_progress(
-        repo_root,
-        f"=== Harness started (max_iterations={max_iterations}, max_failures={max_failures}) ===",
-    )
+            # Build prompt and run agent
+            prompt = build_agent_prompt(item, prd, repo_root, verify=verify_commands)
 
-    while iteration < max_iterations and failures < max_failures:
-        # Reload PRD each iteration (may have been modified)
-        prd = load_prd(repo_root)
+            console.print("\n[bold]Running agent...[/bold]")
+            # The agent may read/append progress.txt, so hand it an up-to-date file
+            progress.flush()
+            agent_success, agent_error = run_agent(repo_root, prompt, model)
 
-        # Check if all done
-        if prd.all_done():
-            console.print("\n[green]All items complete![/green]")
-            append_progress(repo_root, "=== All items complete ===")
-            return 0
-
-        # Select next item (resume "doing" first, then "todo")
-        item, is_resuming = prd.get_next_item()
-        if item is None:
-            console.print("\n[yellow]No more items to process[/yellow]")
-            counts = prd.count_by_state()
-            console.print(
-                f"  Done: {counts[ItemState.DONE]}, Blocked: {counts[ItemState.BLOCKED]}"
-            )
-            append_progress(repo_root, "=== No more items to process ===")
-            return 0 if counts[ItemState.BLOCKED] == 0 else 1
-
-        iteration += 1
-        console.print(f"\n[bold]Iteration {iteration}/{max_iterations}[/bold]")
-        console.print(f"  Item: [cyan]{item.id}[/cyan] - {item.title}")
-        if item.description:
-            console.print(f"\n[bold]Description[/bold]\n{item.description.strip()}")
-        if item.acceptance_criteria:
-            console.print("\n[bold]Acceptance Criteria[/bold]")
-            for criterion in item.acceptance_criteria:
-                console.print(f"- {criterion}")
-        if item.files_hint:
-            console.print("\n[bold]Files[/bold]")
-            for f in item.files_hint:
-                console.print(f"- {f}")
-        verify_commands_preview = item.verify or prd.global_config.verify
-        if verify_commands_preview:
-            console.print("\n[bold]Verify[/bold]")
-            for cmd in verify_commands_preview:
-                console.print(f"- {cmd}")
-
-        if is_resuming:
-            console.print(
-                f"  [yellow]Resuming[/yellow] (attempt {item.status.attempts})"
-            )
-            append_progress(
-                repo_root,
-                f"Resuming item {item.id} (attempt {item.status.attempts}): {item.title}",
-            )
-        else:
-            # Mark as doing and increment attempts (crash-safe write)
-            item.status.state = ItemState.DOING
-            item.status.attempts += 1
-            save_prd(repo_root, prd)
-            console.print(f"  Attempt: {item.status.attempts}")
-            append_progress(
-                repo_root,
-                f"Starting item {item.id} (attempt {item.status.attempts}): {item.title}",
-            )
+            if not agent_success:
+                console.print(f"[red]Agent failed: {agent_error}[/red]")
+                failures += 1
 
-        # Build prompt and run agent
-        prompt = build_agent_prompt(item, prd, repo_root)
+                # Handle failure
+                item.status.last_error = f"Agent error: {agent_error[:500]}"
+                if item.status.attempts >= BLOCKED_THRESHOLD:
+                    item.status.state = ItemState.BLOCKED
+                    console.print(
+                        f"[yellow]Item {item.id} marked as BLOCKED after {item.status.attempts} attempts[/yellow]"
+                    )
+                else:
+                    item.status.state = ItemState.TODO
 
-        console.print("\n[bold]Running agent...[/bold]")
-        agent_success, agent_error = run_agent(repo_root, prompt, model)
+                prd_mtime = save_prd(repo_root, prd)
+                progress.log(
+                    f"Item {item.id} failed (agent error): {agent_error[:200]}"
+                )
+                continue
 
-        if not agent_success:
-            console.print(f"[red]Agent failed: {agent_error}[/red]")
-            failures += 1
+            # Run verification
+            console.print("\n[bold]Running verification...[/bold]")
 
-            # Handle failure
-            item.status.last_error = f"Agent error: {agent_error[:500]}"
-            if item.status.attempts >= BLOCKED_THRESHOLD:
-                item.status.state = ItemState.BLOCKED
-                console.print(
-                    f"[yellow]Item {item.id} marked as BLOCKED after {item.status.attempts} attempts[/yellow]"
+            if not verify_commands:
+                console.print("[yellow]No verification commands configured[/yellow]")
+                verify_passed = True
+                verify_results = []
+            else:
+                verify_passed, verify_results = run_verification(
+                    repo_root, verify_commands, parallel=parallel_verify
                 )
+
+            if verify_passed:
+                console.print("[green]Verification passed![/green]")
+
+                # Mark as done
+                item.status.state = ItemState.DONE
+                item.status.done_at = datetime.now(timezone.utc)
+                item.status.last_error = None
+                prd_mtime = save_prd(repo_root, prd)
+
+                progress.log(f"Item {item.id} completed successfully")
+
+                # Commit if enabled
+                if not no_commit:
+                    console.print("Committing changes...")
+                    commit_msg = f"ralph: Complete {item.id} - {item.title}"
+                    # progress.txt is part of the commit
+                    progress.flush()
+                    if git_commit(repo_root, commit_msg):
+                        console.print(f"[green]Committed: {commit_msg}[/green]")
+                    else:
+                        console.print(
+                            "[yellow]Warning: Commit failed, continuing...[/yellow]"
+                        )
             else:
-                item.status.state = ItemState.TODO
+                console.print("[red]Verification failed![/red]")
+                failures += 1
 
-            save_prd(repo_root, prd)
-            append_progress(
-                repo_root, f"Item {item.id} failed (agent error): {agent_error[:200]}"
-            )
-            continue
-
-        # Run verification
-        console.print("\n[bold]Running verification...[/bold]")
-        verify_commands = item.verify or prd.global_config.verify
-
-        if not verify_commands:
-            console.print("[yellow]No verification commands configured[/yellow]")
-            verify_passed = True
-            verify_results = []
-        else:
-            verify_passed, verify_results = run_verification(repo_root, verify_commands)
-
-        if verify_passed:
-            console.print("[green]Verification passed![/green]")
-
-            # Mark as done
-            item.status.state = ItemState.DONE
-            item.status.done_at = datetime.now(timezone.utc)
-            item.status.last_error = None
-            save_prd(repo_root, prd)
-
-            append_progress(repo_root, f"Item {item.id} completed successfully")
-
-            # Commit if enabled
-            if not no_commit:
-                console.print("Committing changes...")
-                commit_msg = f"ralph: Complete {item.id} - {item.title}"
-                if git_commit(repo_root, commit_msg):
-                    console.print(f"[green]Committed: {commit_msg}[/green]")
-                else:
+                # Build error summary from verification results
+                failed_cmds = [r for r in verify_results if not r["passed"]]
+                error_summary = "; ".join(
+                    f"{r['command']}: {r['stderr'][:100]}" for r in failed_cmds[:3]
+                )
+
+                item.status.last_error = f"Verification failed: {error_summary[:500]}"
+                if item.status.attempts >= BLOCKED_THRESHOLD:
+                    item.status.state = ItemState.BLOCKED
                     console.print(
-                        "[yellow]Warning: Commit failed, continuing...[/yellow]"
+                        f"[yellow]Item {item.id} marked as BLOCKED after {item.status.attempts} attempts[/yellow]"
                     )
-        else:
-            console.print("[red]Verification failed![/red]")
-            failures += 1
-
-            # Build error summary from verification results
-            failed_cmds = [r for r in verify_results if not r["passed"]]
-            error_summary = "; ".join(
-                f"{r['command']}: {r['stderr'][:100]}" for r in failed_cmds[:3]
-            )
+                else:
+                    item.status.state = ItemState.TODO
 
-            item.status.last_error = f"Verification failed: {error_summary[:500]}"
-            if item.status.attempts >= BLOCKED_THRESHOLD:
-                item.status.state = ItemState.BLOCKED
-                console.print(
-                    f"[yellow]Item {item.id} marked as BLOCKED after {item.status.attempts} attempts[/yellow]"
+                prd_mtime = save_prd(repo_root, prd)
+                progress.log(
+                    f"Item {item.id} failed verification: {error_summary[:200]}"
                 )
-            else:
-                item.status.state = ItemState.TODO
 
-            save_prd(repo_root, prd)
-            append_progress(
-                repo_root, f"Item {item.id} failed verification: {error_summary[:200]}"
+        # Loop ended due to limits
+        if failures >= max_failures:
+            console.print(
+                f"\n[red]Stopped: Max failures ({max_failures}) reached[/red]"
             )
+            progress.log(f"=== Stopped: Max failures ({max_failures}) reached ===")
+            return 1
 
-    # Loop ended due to limits
-    if failures >= max_failures:
-        console.print(f"\n[red]Stopped: Max failures ({max_failures}) reached[/red]")
-        append_progress(
-            repo_root, f"=== Stopped: Max failures ({max_failures}) reached ==="
-        )
-        return 1
-
-    if iteration >= max_iterations:
-        console.print(
-            f"\n[yellow]Stopped: Max iterations ({max_iterations}) reached[/yellow]"
-        )
-        append_progress(
-            repo_root, f"=== Stopped: Max iterations ({max_iterations}) reached ==="
-        )
-        return 1
+        if iteration >= max_iterations:
+            console.print(
+                f"\n[yellow]Stopped: Max iterations ({max_iterations}) reached[/yellow]"
+            )
+            progress.log(f"=== Stopped: Max iterations ({max_iterations}) reached ===")
+            return 1
 
-    return 0
+        return 0
@@ -1,14 +1,26 @@
 """Pydantic models for ralph PRD schema."""
 
+import sys
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
-from pydantic import AliasChoices, BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    field_validator,
+)
 
 
 class ItemState(str, Enum):
-    """State of a work item."""
+    """State of a work item.
+
+    Loaded and assigned states are always members of this enum, so compare
+    them by identity (``state is ItemState.TODO``).
+    """
 
     TODO = "todo"
     DOING = "doing"
@@ -16,26 +28,79 @@ class ItemState(str, Enum):
     BLOCKED = "blocked"
 
 
-class ItemStatus(BaseModel):
-    """Status tracking for a work item."""
+# JSON value -> member, for loaders that skip pydantic; a dict hit is much
+# cheaper than ItemState(value), which goes through EnumType.__call__
+STATE_BY_VALUE = {state.value: state for state in ItemState}
+
+# States an item never leaves on its own; the harness is done once every item
+# is in one of them
+FINISHED_STATES = frozenset({ItemState.DONE, ItemState.BLOCKED})
+
+# Zero count for every state; count_by_state copies it rather than rebuilding
+# it from the enum on each call
+_EMPTY_STATE_COUNTS = dict.fromkeys(ItemState, 0)
+
+
+@dataclass(slots=True)
+class ItemStatus:
+    """Status tracking for a work item.
+
+    A plain slotted dataclass rather than a model: there is one per item and
+    it has no validators of its own. Pydantic validates it when building a
+    WorkItem from data, but passes ready-made instances through unchecked.
+    """
 
     state: ItemState = ItemState.TODO
     attempts: int = 0
     last_error: Optional[str] = None
     done_at: Optional[datetime] = None
 
+    def __post_init__(self) -> None:
+        # Keep state an ItemState member for direct construction too, so
+        # identity comparisons hold
+        if not isinstance(self.state, ItemState):
+            self.state = STATE_BY_VALUE.get(self.state) or ItemState(self.state)
+
+
+# Keys accepted by ItemStatus; validated loads ignore any others
+ITEM_STATUS_FIELDS = frozenset(field.name for field in fields(ItemStatus))
+
 
 class WorkItem(BaseModel):
-    """A single work item in the PRD."""
+    """A single work item in the PRD.
+
+    The string-list fields are tuples: they are read-only once loaded, so
+    change them by assigning a new sequence rather than mutating in place.
+    """
 
     id: str
     title: str
     description: str
-    acceptance_criteria: list[str] = Field(default_factory=list)
-    files_hint: list[str] = Field(default_factory=list)
-    verify: Optional[list[str]] = None
+    acceptance_criteria: tuple[str, ...] = Field(default_factory=tuple)
+    files_hint: tuple[str, ...] = Field(default_factory=tuple)
+    # Empty means "use the global verify commands"
+    verify: tuple[str, ...] = Field(default_factory=tuple)
     status: ItemStatus = Field(default_factory=ItemStatus)
 
+    @field_validator("verify", mode="before")
+    @classmethod
+    def _null_verify(cls, value: object) -> object:
+        # Older PRDs store "verify": null for "no item-specific commands"
+        return () if value is None else value
+
+    @field_validator("id", mode="after")
+    @classmethod
+    def _intern_id(cls, value: str) -> str:
+        # Interned ids let lookups short-circuit string comparison on identity
+        return sys.intern(value)
+
+
+# Validator for bare item lists, built once at import rather than per call
+WORK_ITEMS_ADAPTER = TypeAdapter(list[WorkItem])
+
+# Parses stored timestamps for from_trusted_dict, the same way validation does
+DATETIME_ADAPTER = TypeAdapter(datetime)
+
 
 class ProjectMeta(BaseModel):
     """Project metadata."""
@@ -48,7 +113,7 @@ class ProjectMeta(BaseModel):
 class GlobalConfig(BaseModel):
     """Global configuration including verification commands."""
 
-    verify: list[str] = Field(default_factory=list)
+    verify: tuple[str, ...] = Field(default_factory=tuple)
 
 
 class PRD(BaseModel):
@@ -61,14 +126,94 @@ class PRD(BaseModel):
     global_config: GlobalConfig = Field(
         default_factory=GlobalConfig,
         serialization_alias="global",
-        validation_alias=AliasChoices("global", "global_config"),
+        # populate_by_name also accepts the field name, "global_config"
+        validation_alias="global",
     )
     items: list[WorkItem] = Field(default_factory=list)
 
+    # id -> position in items, built lazily by get_item_by_id
+    _id_index: Optional[dict[str, int]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        if name == "items":
+            # Drop the id index so it is rebuilt from the new list
+            self._id_index = None
+
+    @classmethod
+    def load_json_bytes(cls, data: bytes) -> "PRD":
+        """Parse and validate a PRD from raw JSON in a single pydantic-core pass."""
+        return cls.model_validate_json(data)
+
+    @classmethod
+    def validate_items(cls, data: Union[list[dict], bytes, str]) -> list[WorkItem]:
+        """Validate a list of work items without re-validating a whole PRD.
+
+        Accepts parsed item dicts or the raw JSON of an item array.
+        """
+        if isinstance(data, (bytes, str)):
+            return WORK_ITEMS_ADAPTER.validate_json(data)
+        return WORK_ITEMS_ADAPTER.validate_python(data)
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> "PRD":
+        """Build a PRD from parsed JSON without running validation.
+
+        Nested models are constructed directly with model_construct (and
+        ItemStatus via its plain constructor, which coerces the state to
+        ItemState). Fields are still converted to their declared types, so
+        the result serializes like a validated PRD; unknown keys are dropped
+        and a missing required key raises KeyError. Use this for documents
+        ralph wrote itself, and model_validate for anything that may have
+        been edited.
+        """
+        items = []
+        for raw_item in data.get("items", []):
+            raw_status = raw_item.get("status") or {}
+            status = ItemStatus(
+                **{
+                    key: value
+                    for key, value in raw_status.items()
+                    if key in ITEM_STATUS_FIELDS
+                }
+            )
+            if isinstance(status.done_at, str):
+                status.done_at = DATETIME_ADAPTER.validate_python(status.done_at)
+            items.append(
+                WorkItem.model_construct(
+                    id=sys.intern(raw_item["id"]),
+                    title=raw_item["title"],
+                    description=raw_item["description"],
+                    acceptance_criteria=tuple(raw_item.get("acceptance_criteria", ())),
+                    files_hint=tuple(raw_item.get("files_hint", ())),
+                    verify=tuple(raw_item.get("verify") or ()),
+                    status=status,
+                )
+            )
+
+        project = data["project"]
+        raw_global = data.get("global", data.get("global_config", {}))
+        return cls.model_construct(
+            version=data.get("version", 1),
+            project=ProjectMeta.model_construct(
+                name=project["name"],
+                **{
+                    key: value
+                    for key, value in project.items()
+                    if key in ProjectMeta.model_fields and key != "name"
+                },
+            ),
+            global_config=GlobalConfig.model_construct(
+                verify=tuple(raw_global.get("verify", ()))
+            ),
+            items=items,
+        )
+
     def get_next_todo(self) -> Optional[WorkItem]:
         """Get the first item with state == todo."""
+        todo = ItemState.TODO  # local lookup inside the loop
         for item in self.items:
-            if item.status.state == ItemState.TODO:
+            if item.status.state is todo:
                 return item
         return None
 
@@ -83,35 +228,60 @@ class PRD(BaseModel):
         1. First item with state == "doing" (resume interrupted work)
         2. First item with state == "todo" (start new work)
         """
-        # First, check for any in-progress item to resume
+        # Single pass: return the first "doing" item as soon as it is seen,
+        # remembering the first "todo" item to fall back on
+        doing = ItemState.DOING
+        todo = ItemState.TODO
+        first_todo = None
         for item in self.items:
-            if item.status.state == ItemState.DOING:
+            state = item.status.state
+            if state is doing:
                 return item, True
+            if first_todo is None and state is todo:
+                first_todo = item
 
-        # Otherwise, pick the first todo item
-        for item in self.items:
-            if item.status.state == ItemState.TODO:
-                return item, False
-
-        return None, False
+        return first_todo, False
 
     def get_item_by_id(self, item_id: str) -> Optional[WorkItem]:
-        """Get an item by its ID."""
-        for item in self.items:
-            if item.id == item_id:
-                return item
-        return None
+        """Get an item by its ID.
+
+        Lookups go through a cached id -> position index. A hit is checked
+        against the item now at that position, and a miss or a stale hit
+        rebuilds the index once, so in-place edits of prd.items are picked up.
+        If an in-place edit adds a duplicate of an existing id ahead of it,
+        the old item can still win; assign prd.items = ... for such changes.
+        """
+        item_id = sys.intern(item_id)
+        items = self.items
+        cached = self._id_index
+        if cached is not None:
+            position = cached.get(item_id)
+            if (
+                position is not None
+                and position < len(items)
+                and items[position].id == item_id
+            ):
+                return items[position]
+
+        index: dict[str, int] = {}
+        for position, item in enumerate(items):
+            # Keep the first position so duplicate ids resolve as a scan would
+            index.setdefault(item.id, position)
+        self._id_index = index
+        position = index.get(item_id)
+        return None if position is None else items[position]
 
     def all_done(self) -> bool:
         """Check if all items are done or blocked."""
-        return all(
-            item.status.state in (ItemState.DONE, ItemState.BLOCKED)
-            for item in self.items
-        )
+        finished = FINISHED_STATES  # local lookup inside the loop
+        for item in self.items:
+            if item.status.state not in finished:
+                return False
+        return True
 
     def count_by_state(self) -> dict[ItemState, int]:
         """Count items by state."""
-        counts = {state: 0 for state in ItemState}
+        counts = _EMPTY_STATE_COUNTS.copy()
         for item in self.items:
             counts[item.status.state] += 1
         return counts